@@ -6,23 +6,104 @@ Tracks all applications in Google Sheets
 """
 
 import os
+import re
+import sys
 import json
 import time
+import logging
 import random
+import shelve
+import signal
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import closing, contextmanager
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from urllib.parse import urlencode
+
+# Selenium, httpx, the Google API client and the other third-party packages are imported inside the
+# functions that use them, so a misconfigured run fails before paying their import cost
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 DEFAULT_TIMEZONE = "America/Argentina/Buenos_Aires"
-MIN_SALARY_USD = 500
-MAX_APPLICATIONS_PER_DAY = random.randint(20, 30)
+# Monthly pay in US dollars, also the "$500+" written to the sheet
+MIN_MONTHLY_SALARY_USD = 500
+DAILY_APPLICATIONS_RANGE = (20, 30)
 APPLICATION_DELAY = 5
+SEARCH_WORKERS = 6
+CACHE_CLEAR_EVERY = 5
+DRIVER_RESTART_EVERY = 10
+DRIVER_QUIT_TIMEOUT = 5
+GUEST_CONCURRENCY = 8
+SHEETS_BATCH_SIZE = 10
+SHEETS_FLUSH_TIMEOUT = 30
+SEEN_CACHE_FILE = ".linkedin_cache"
+# Applied jobs are remembered for about as long as a posting stays open; a single day
+# would expire each entry just before the next daily run could use it
+SEEN_CACHE_TTL = 30 * 24 * 60 * 60
+COOKIES_BACKUP_FILE = ".linkedin_cookies.json"
+DEFAULT_PROFILE_DIR = "/tmp/linkedin-profile"
+REQUIRED_ENV_VARS = ("GOOGLE_SHEETS_CREDS", "GOOGLE_SHEET_ID")
+# No sheet name, so rows go to the first sheet whatever it is called
+SHEETS_RANGE = "A:I"
+SHEETS_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive.file"
+]
+
+# Search
+SEARCH_KEYWORDS = "fullstack developer"
+# Only postings from the last 24 hours; older ones were already seen by the previous daily run
+SEARCH_POSTED_WITHIN = "r86400"
+JOB_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# Public job search endpoint that returns job cards as plain HTML, no browser needed
+GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Static assets never needed to read job pages, blocked at the network layer
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff*", "*.css", "*.mp4"]
+
+# CSS selectors, matched natively by querySelector rather than walked with XPath
+JOB_RESULTS_SEL = "div.base-card, .jobs-search-no-results-banner"
+# Labels are matched in both English and Spanish, the two UI languages the target countries use
+EASY_APPLY_SEL = (
+    "button.jobs-apply-button[aria-label*='Easy Apply'], "
+    "button.jobs-apply-button[aria-label*='Solicitud sencilla']"
+)
+EASY_APPLY_MODAL_SEL = "div.jobs-easy-apply-modal"
+EASY_APPLY_FORM_SEL = "div.jobs-easy-apply-modal form"
+SUBMIT_SEL = "button[aria-label*='Submit application'], button[aria-label*='Enviar solicitud']"
+TEXT_INPUT_SEL = "input[type=text]:not([readonly])"
+JOB_DESCRIPTION_SEL = "div.jobs-description, div.show-more-less-html__markup"
+
+# Pay amounts such as "$60k/yr", "US$ 3,000 per month", "$25 / hr" or "$2.500 USD por mes", compiled once.
+# A pay period is required, which leaves out figures like "we raised $50M".
+# Groups: currency before, whole part, decimals, magnitude, currency after, pay period
+SALARY_CURRENCIES = "USD|US|ARS|MXN|COP|CLP|PEN|UYU|PYG|BOB|VES|CRC|PAB|GTQ|HNL|NIO|DOP"
+SALARY_RE = re.compile(
+    rf"(?:(?<![a-z])({SALARY_CURRENCIES})\s?)?\$\s?(\d{{1,3}}(?:[.,]\d{{3}})+|\d+)(?:[.,](\d{{1,2}}))?\s?([kmb])?\b\+?"
+    rf"\s?(?:({SALARY_CURRENCIES})\b\s?)?(?:/|per|por|al|a|an|la)?\s?"
+    r"(hours?|hr|h|hora|months?|monthly|mo|mes|mensual(?:es)?|years?|yearly|yr|año|anual(?:es)?|annual(?:ly)?)\b",
+    re.IGNORECASE
+)
+JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?]*-)?(\d+)")
+# Stipends and allowances are stated like pay; amounts in a clause naming one are not salaries
+SALARY_PERK_RE = re.compile(
+    r"\b(?:stipend|allowance|budget|reimburs|perk|beca|subsidio|reintegro|presupuesto|vi[aá]tico|auxilio)",
+    re.IGNORECASE
+)
+SALARY_CLAUSE_END_RE = re.compile(r"[;,:\n]|\.\s")
+SALARY_MAGNITUDES = {'k': 1e3, 'm': 1e6, 'b': 1e9}
+HOURS_PER_MONTH = 2080 / 12
+MONTHS_PER_YEAR = 12
 
 # Target countries
 TARGET_COUNTRIES = [
@@ -31,15 +112,87 @@ TARGET_COUNTRIES = [
     "Guatemala", "El Salvador", "Honduras", "Nicaragua", "Dominican Republic"
 ]
 
+def build_search_url(base_url, country):
+    """Build an Easy Apply job search URL for a country, with every parameter URL-encoded"""
+    return base_url + "?" + urlencode({
+        'keywords': SEARCH_KEYWORDS,
+        'location': country,
+        'f_WT': '1',
+        'f_EA': 'true',
+        'f_TPR': SEARCH_POSTED_WITHIN
+    })
+
+# (country, url) pairs, built once at import
+SEARCH_URLS = tuple((c, build_search_url(JOB_SEARCH_URL, c)) for c in TARGET_COUNTRIES)
+GUEST_SEARCH_URLS = tuple((c, build_search_url(GUEST_SEARCH_URL, c)) for c in TARGET_COUNTRIES)
+
+def parse_salary(text):
+    """Highest monthly USD pay among the US dollar amounts in a text, None if it states none"""
+    amounts = []
+    for match in SALARY_RE.finditer(text):
+        before, whole, decimals, magnitude, after, period = match.groups()
+        # "$" alone is read as US dollars; local-currency amounts cannot be compared without a rate
+        if (before or after or 'USD').upper() not in ('US', 'USD'):
+            continue
+        start = max((m.end() for m in SALARY_CLAUSE_END_RE.finditer(text, 0, match.start())), default=0)
+        end = SALARY_CLAUSE_END_RE.search(text, match.end())
+        if SALARY_PERK_RE.search(text, start, end.start() if end else len(text)):
+            continue
+        # Both "1.500.000" and "1,500,000" group thousands
+        amount = float(re.sub(r"[.,]", "", whole) + "." + (decimals or "0"))
+        amount *= SALARY_MAGNITUDES.get((magnitude or '').lower(), 1)
+        period = period.lower()
+        if period.startswith('h'):
+            amount *= HOURS_PER_MONTH
+        elif not period.startswith('m'):
+            amount /= MONTHS_PER_YEAR
+        amounts.append(amount)
+    # A range or a salary next to smaller figures is judged by its highest amount
+    return max(amounts, default=None)
+
+def parse_job_cards(html, limit=10):
+    """Extract title, company and link from the job cards of a search results page"""
+    from selectolax.parser import HTMLParser
+    
+    jobs = []
+    for card in HTMLParser(html).css("div.base-card")[:limit]:
+        title = card.css_first(".base-search-card__title")
+        company = card.css_first(".base-search-card__subtitle")
+        link = card.css_first("a.base-card__full-link")
+        if not (title and link and link.attributes.get('href')):
+            continue
+        jobs.append({
+            'title': title.text().strip(),
+            'company': company.text().strip() if company else "",
+            'link': link.attributes['href']
+        })
+    return jobs
+
 class LinkedInJobAutomation:
     def __init__(self):
         self.driver = None
-        self.sheets_client = None
-        self.worksheet = None
+        self._warm_profile = False
+        self.sheets = None
+        self.sheet_id = None
         self.applications_count = 0
+        # Daily quota, drawn per run rather than once at import
+        self.max_apps = random.randint(*DAILY_APPLICATIONS_RANGE)
+        self._today = None
+        self._salary_str = f"${MIN_MONTHLY_SALARY_USD}+"
+        self._pending_rows = []
+        # Applying state is created by run(), so search worker processes only carry a driver
+        self._io_pool = None
+        self._flush = None
+        self._seen_links = None
+        self._seen_titles = set()
+        self._seen_cache = None
 
-    def initialize_driver(self):
-        """Initialize Selenium WebDriver"""
+    def _make_driver(self, profile_dir=None):
+        """Create a Chrome WebDriver, on a Selenium Grid hub if SELENIUM_HUB_URL is set"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -48,11 +201,105 @@ class LinkedInJobAutomation:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.set_page_load_timeout(30)
+        # Only page text is read, so skip images, stylesheets and fonts and return at DOMContentLoaded
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--window-size=1280,900")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        chrome_options.add_argument("--mute-audio")
+        
+        # No background services, sync or telemetry, and no throttling of hidden renderers
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        
+        # A persistent profile keeps the LinkedIn session between runs
+        if profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument("--profile-directory=Default")
+        
+        hub_url = os.environ.get('SELENIUM_HUB_URL')
+        if hub_url:
+            driver = webdriver.Remote(command_executor=hub_url, options=chrome_options)
+        else:
+            # chromedriver leads its own process group, so a hung quit can kill Chrome along with it
+            driver = webdriver.Chrome(options=chrome_options, service=Service(popen_kw={'start_new_session': True}))
+        driver.set_page_load_timeout(30)
+        
+        # Content settings only cover some resource types; DevTools blocks the rest before they are requested
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+
+    def initialize_driver(self):
+        """Initialize Selenium WebDriver"""
+        profile_dir = os.environ.get('CHROME_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+        # A missing or empty profile holds no session, so checking it for one would only waste a page load
+        self._warm_profile = os.path.isdir(profile_dir) and bool(os.listdir(profile_dir))
+        self.driver = self._make_driver(profile_dir)
+
+    def _quit_driver(self, driver):
+        """Quit a driver, killing its chromedriver process if quit() fails or takes longer than DRIVER_QUIT_TIMEOUT"""
+        def quit_quietly():
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug("Driver quit failed: %s", e)
+        
+        quitter = threading.Thread(target=quit_quietly, daemon=True)
+        quitter.start()
+        quitter.join(DRIVER_QUIT_TIMEOUT)
+        
+        # Remote (Grid) drivers have no local chromedriver process to kill
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if process and process.poll() is None:
+            logger.warning("✗ chromedriver did not shut down, killing it and its browser")
+            # A surviving Chrome would keep the profile locked against the next launch
+            if hasattr(os, 'killpg'):
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                process.kill()
+
+    @contextmanager
+    def _managed_driver(self):
+        """Start the main browser and shut it down on exit, however the block ends"""
+        self.initialize_driver()
+        try:
+            yield self.driver
+        finally:
+            self._quit_driver(self.driver)
+            self.driver = None
+
+    def _recycle_driver(self, countries_done):
+        """Bound browser memory by clearing its cache every few countries and restarting it every few more"""
+        if countries_done % DRIVER_RESTART_EVERY == 0:
+            logger.info("♻ Restarting the browser after %d countries", countries_done)
+            self._quit_driver(self.driver)
+            self.initialize_driver()
+            self.authenticate_linkedin_with_cookies()
+        elif countries_done % CACHE_CLEAR_EVERY == 0 and hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
 
     def setup_google_sheets(self):
         """Setup Google Sheets connection using service account"""
+        from google.oauth2.service_account import Credentials
+        from googleapiclient.discovery import build
+        
         credentials_json = os.environ.get('GOOGLE_SHEETS_CREDS')
         sheet_id = os.environ.get('GOOGLE_SHEET_ID')
         
@@ -60,204 +307,461 @@ class LinkedInJobAutomation:
             raise ValueError("Missing GOOGLE_SHEETS_CREDS or GOOGLE_SHEET_ID environment variables")
         
         credentials_dict = json.loads(credentials_json)
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
+        credentials = Credentials.from_service_account_info(credentials_dict, scopes=SHEETS_SCOPES)
+        
+        # The bundled discovery document is used, so building the client makes no request;
+        # its authorized HTTP object keeps one connection alive for every append
+        self.sheets = build('sheets', 'v4', credentials=credentials, cache_discovery=False).spreadsheets()
+        self.sheet_id = sheet_id
+
+    def _is_logged_in(self, driver, timeout):
+        """Check for the mynetwork link, which is only rendered for a signed-in session"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, "//a[@href='/mynetwork/']"))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _linkedin_cookies(self):
+        """LinkedIn session cookies from environment variables, or from the last backup if they are unset"""
+        li_at = os.environ.get('LINKEDIN_LI_AT')
+        jsessionid = os.environ.get('LINKEDIN_JSESSIONID')
+        lidc = os.environ.get('LINKEDIN_LIDC')
+        
+        if not all([li_at, jsessionid, lidc]):
+            if os.path.exists(COOKIES_BACKUP_FILE):
+                with open(COOKIES_BACKUP_FILE) as f:
+                    return json.load(f)
+            raise ValueError("Missing LinkedIn cookies (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID, LINKEDIN_LIDC)")
+        
+        return [
+            {'name': 'li_at', 'value': li_at, 'domain': '.linkedin.com', 'path': '/', 'secure': True, 'httpOnly': True},
+            {'name': 'JSESSIONID', 'value': jsessionid, 'domain': '.linkedin.com', 'path': '/'},
+            {'name': 'lidc', 'value': lidc, 'domain': '.linkedin.com', 'path': '/'}
         ]
-        credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
-        self.sheets_client = gspread.authorize(credentials)
-        self.worksheet = self.sheets_client.open_by_key(sheet_id).sheet1
 
-    def authenticate_linkedin_with_cookies(self):
+    def _set_cookies(self, driver, cookies):
+        """Add cookies to the browser, in a single DevTools command when the driver supports it"""
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            return
+        
+        # Remote (Grid) drivers have no DevTools access and can only set cookies for the current domain
+        if 'linkedin.com' not in driver.current_url:
+            driver.get('https://www.linkedin.com/')
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+
+    def _backup_cookies(self, driver):
+        """Save the browser's LinkedIn cookies as a fallback for when the profile and env cookies are gone"""
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return
+        try:
+            cookies = [
+                {k: c[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')}
+                for c in driver.execute_cdp_cmd("Network.getAllCookies", {})['cookies']
+                if c['domain'].endswith('linkedin.com')
+            ]
+            # Session cookies are credentials, keep the file private to the user
+            with open(os.open(COOKIES_BACKUP_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+                json.dump(cookies, f)
+        except Exception as e:
+            logger.warning("✗ Failed to back up LinkedIn cookies: %s", e)
+
+    def authenticate_linkedin_with_cookies(self, driver=None, saved_profile=True):
         """Authenticate to LinkedIn using cookies instead of email/password"""
+        driver = driver or self.driver
         try:
-            # Get cookies from environment variables
-            li_at = os.environ.get('LINKEDIN_LI_AT')
-            jsessionid = os.environ.get('LINKEDIN_JSESSIONID')
-            lidc = os.environ.get('LINKEDIN_LIDC')
-            
-            if not all([li_at, jsessionid, lidc]):
-                raise ValueError("Missing LinkedIn cookies (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID, LINKEDIN_LIDC)")
-            
-            # Navigate to LinkedIn
-            self.driver.get('https://www.linkedin.com/feed/')
-            time.sleep(2)
-            
-            # Add cookies to the browser
-            self.driver.add_cookie({
-                'name': 'li_at',
-                'value': li_at,
-                'domain': '.linkedin.com',
-                'path': '/'
-            })
-            self.driver.add_cookie({
-                'name': 'JSESSIONID',
-                'value': jsessionid,
-                'domain': '.linkedin.com',
-                'path': '/'
-            })
-            self.driver.add_cookie({
-                'name': 'lidc',
-                'value': lidc,
-                'domain': '.linkedin.com',
-                'path': '/'
-            })
+            # Navigate to LinkedIn; a saved profile may already be signed in
+            if saved_profile and self._warm_profile:
+                driver.get('https://www.linkedin.com/feed/')
+                if self._is_logged_in(driver, 3):
+                    logger.info("✓ Already authenticated to LinkedIn via saved profile")
+                    self._backup_cookies(driver)
+                    return
             
-            # Refresh page to apply cookies
-            self.driver.refresh()
-            time.sleep(3)
+            # Cookies set before navigating apply to the next load, so no refresh is needed
+            self._set_cookies(driver, self._linkedin_cookies())
+            driver.get('https://www.linkedin.com/feed/')
             
             # Verify we're logged in by checking for mynetwork link
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, "//a[@href='/mynetwork/']"))
-                )
-                print("✓ Successfully authenticated to LinkedIn via cookies")
-            except:
-                print("✗ Failed to verify LinkedIn authentication")
+            if not self._is_logged_in(driver, 10):
+                logger.error("✗ Failed to verify LinkedIn authentication")
                 raise Exception("Authentication verification failed")
+            logger.info("✓ Successfully authenticated to LinkedIn via cookies")
+            if saved_profile:
+                self._backup_cookies(driver)
                 
         except Exception as e:
-            print(f"❌ Error during LinkedIn authentication: {str(e)}")
+            logger.error("❌ Error during LinkedIn authentication: %s", e)
             raise
 
-    def search_jobs_in_country(self, country):
+    async def fetch_country(self, client, country, url):
+        """Fetch job listings for a country from the guest endpoint, None if the request failed"""
+        import httpx
+        
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("✗ Guest search failed for %s: %s", country, e)
+            return None
+        
+        jobs = parse_job_cards(response.text)
+        logger.info("🔍 Found %d jobs in %s", len(jobs), country)
+        return jobs
+
+    async def fetch_all_countries(self):
+        """Fetch job listings for every target country concurrently"""
+        import httpx
+        
+        # The connection pool caps concurrent requests; the rest queue for a free connection
+        limits = httpx.Limits(max_connections=GUEST_CONCURRENCY, max_keepalive_connections=GUEST_CONCURRENCY)
+        timeout = httpx.Timeout(15, pool=None)
+        async with httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT}, limits=limits, timeout=timeout, follow_redirects=True
+        ) as client:
+            return await asyncio.gather(*[self.fetch_country(client, c, url) for c, url in GUEST_SEARCH_URLS])
+
+    def search_jobs_in_country(self, driver, country, url):
         """Search for jobs in a specific country with Easy Apply filter"""
         try:
-            base_url = "https://www.linkedin.com/jobs/search/"
-            params = {
-                'keywords': 'fullstack developer',
-                'location': country,
-                'f_WT': '1',
-                'f_EA': 'true',
-                'salary': f'{MIN_SALARY_USD}000-'
-            }
-            
-            url = base_url + "?" + "&".join([f"{k}={v}" for k, v in params.items()])
-            self.driver.get(url)
-            time.sleep(3)
+            logger.info("🔍 Searching jobs in %s...", country)
+            driver.get(url)
             
-            return self.get_job_listings()
+            return self.get_job_listings(driver)
         except Exception as e:
-            print(f"✗ Error searching jobs in {country}: {str(e)}")
+            logger.warning("✗ Error searching jobs in %s: %s", country, e)
             return []
 
-    def get_job_listings(self):
-        """Extract job listings from current page"""
+    def _job_stream(self):
+        """Yield (country, jobs) for every target country in order, consuming browser search results only as needed"""
+        logger.info("🔍 Searching jobs in all target countries...")
+        guest_jobs = dict(zip(TARGET_COUNTRIES, asyncio.run(self.fetch_all_countries())))
+        
+        # Countries the guest endpoint could not serve fall back to a browser search.
+        # Each worker process drives its own browser; WebDriver sessions must not be shared
+        fallback = [(c, url) for c, url in SEARCH_URLS if guest_jobs[c] is None]
+        executor = None
+        futures = {}
+        if fallback:
+            executor = ProcessPoolExecutor(
+                max_workers=min(SEARCH_WORKERS, len(fallback)),
+                initializer=_init_search_worker
+            )
+            futures = {c: executor.submit(scrape_country, c, url) for c, url in fallback}
+        try:
+            for country in TARGET_COUNTRIES:
+                if country in futures:
+                    try:
+                        jobs = futures.pop(country).result()
+                    except Exception as e:
+                        logger.warning("✗ Error searching jobs in %s: %s", country, e)
+                        jobs = []
+                    if not futures:
+                        # Every browser search is done, close the worker browsers before applying
+                        executor.shutdown()
+                else:
+                    jobs = guest_jobs[country]
+                
+                yield country, jobs
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+    def get_job_listings(self, driver):
+        """Extract job listings from the driver's current page"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         jobs = []
         try:
-            job_cards = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "base-card"))
+            # Results and the empty-results banner both mean the search page is ready
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_RESULTS_SEL))
             )
             
-            for card in job_cards[:10]:
-                try:
-                    title = card.find_element(By.CLASS_NAME, "base-search-card__title").text
-                    company = card.find_element(By.CLASS_NAME, "base-search-card__subtitle").text
-                    link = card.find_element(By.CLASS_NAME, "base-card__full-link").get_attribute("href")
-                    jobs.append({
-                        'title': title,
-                        'company': company,
-                        'link': link
-                    })
-                except:
-                    continue
-        except:
-            pass
+            # One script call returns just the cards' markup, parsed locally instead of queried field by field
+            cards_html = driver.execute_script("""
+                return Array.from(document.querySelectorAll('div.base-card')).slice(0, 10)
+                    .map(card => card.outerHTML).join('');
+            """)
+            jobs = parse_job_cards(cards_html)
+        except TimeoutException:
+            # Neither results nor the empty-results banner rendered; anything else is a real error
+            logger.warning("✗ Search results page did not load in time")
         
         return jobs
 
-    def apply_to_job(self, job_url, job_title, company, country):
-        """Apply to a specific job"""
+    def _wait(self, by, locator, timeout=10, clickable=False, invisible=False):
+        """Wait until an element on the main driver is visible, clickable or gone, and return the condition's result"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        if invisible:
+            condition = EC.invisibility_of_element_located
+        else:
+            condition = EC.element_to_be_clickable if clickable else EC.visibility_of_element_located
+        return WebDriverWait(self.driver, timeout).until(condition((by, locator)))
+
+    def _job_key(self, link):
+        """LinkedIn job ID of a link, or the link without its tracking query string if it has none"""
+        match = JOB_ID_RE.search(link)
+        return match.group(1) if match else link.split('?', 1)[0]
+
+    def _cache_key(self, link):
+        """Key of a job in the on-disk applied-jobs cache"""
+        return hashlib.sha1(self._job_key(link).encode()).hexdigest()
+
+    def _open_seen_cache(self):
+        """Open the on-disk cache of applied jobs, dropping entries older than SEEN_CACHE_TTL"""
+        self._seen_cache = shelve.open(SEEN_CACHE_FILE)
+        now = time.time()
+        for key in [k for k, applied_at in self._seen_cache.items() if now - applied_at >= SEEN_CACHE_TTL]:
+            del self._seen_cache[key]
+
+    def _is_duplicate(self, job):
+        """Check whether a job was already seen this run or applied to recently, and mark it as seen"""
+        link = self._job_key(job['link'])
+        title = (job['title'], job['company'])
+        if link in self._seen_links or title in self._seen_titles:
+            return True
+        self._seen_links.add(link)
+        self._seen_titles.add(title)
+        return self._seen_cache is not None and self._cache_key(job['link']) in self._seen_cache
+
+    def apply_to_job(self, job_url, job_title, company, country, not_before=0):
+        """Apply to a specific job, holding the Easy Apply click until the monotonic time not_before"""
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+        
         try:
             self.driver.get(job_url)
-            time.sleep(2)
             
-            # Find and click Easy Apply button
-            easy_apply_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Easy Apply')]"))
-            )
-            easy_apply_button.click()
-            time.sleep(2)
+            # Page loads are eager, so wait for the button or the description before trusting a missing button:
+            # postings that apply off-site slip through the Easy Apply filter and are skipped at once
+            self._wait(By.CSS_SELECTOR, f"{EASY_APPLY_SEL}, {JOB_DESCRIPTION_SEL}")
+            if not self.driver.find_elements(By.CSS_SELECTOR, EASY_APPLY_SEL):
+                logger.info("✗ Skipping %s: no Easy Apply button", job_title)
+                return False
+            easy_apply_button = self._wait(By.CSS_SELECTOR, EASY_APPLY_SEL, clickable=True)
+            
+            # Skip postings whose US dollar amounts are all below the minimum; the search cannot filter on pay
+            description = self.driver.find_elements(By.CSS_SELECTOR, JOB_DESCRIPTION_SEL)
+            salary = parse_salary(description[0].text) if description else None
+            if salary is not None and salary < MIN_MONTHLY_SALARY_USD:
+                logger.info("✗ Skipping %s: salary $%d a month is below the minimum", job_title, salary)
+                return False
+            
+            # The page loaded while the delay since the previous application was running
+            time.sleep(max(0, not_before - time.monotonic()))
+            try:
+                easy_apply_button.click()
+            except StaleElementReferenceException:
+                # The page re-rendered during the delay; the button is found again right away
+                self._wait(By.CSS_SELECTOR, EASY_APPLY_SEL, clickable=True).click()
+            self._wait(By.CSS_SELECTOR, EASY_APPLY_MODAL_SEL)
             
             # Handle any form fields that appear
             self.handle_application_form()
             
             # Submit application
-            submit_button = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'Enviar')]")[-1]
+            submit_button = self._wait(By.CSS_SELECTOR, SUBMIT_SEL, clickable=True)
             submit_button.click()
             
-            # Log to Google Sheets
+            # The application is sent once submit is clicked, so it is recorded before waiting on the modal
             self.log_application(job_title, company, country, job_url, "Postulado")
             self.applications_count += 1
-            print(f"✓ Applied to {job_title} at {company}")
+            logger.info("✓ Applied to %s at %s", job_title, company)
+            
+            # LinkedIn may keep the modal open with a confirmation; the next page load replaces it anyway
+            try:
+                self._wait(By.CSS_SELECTOR, EASY_APPLY_MODAL_SEL, invisible=True)
+            except TimeoutException:
+                logger.warning("✗ Application modal for %s did not close", job_title)
             return True
         except Exception as e:
-            print(f"✗ Failed to apply to {job_title}: {str(e)}")
+            logger.warning("✗ Failed to apply to %s: %s", job_title, e)
             return False
 
     def handle_application_form(self):
         """Handle form fields in application modal"""
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import JavascriptException, TimeoutException
+        
         try:
-            time.sleep(2)
-            text_inputs = self.driver.find_elements(By.XPATH, "//input[@type='text']")
-            for inp in text_inputs:
-                try:
-                    inp.send_keys("Automated")
-                except:
-                    pass
-        except:
-            pass
+            self._wait(By.CSS_SELECTOR, EASY_APPLY_FORM_SEL)
+            
+            # Fill every empty input in-page with one script call instead of one WebDriver call per input,
+            # leaving fields LinkedIn prefilled from the profile untouched.
+            # The form is React-controlled, so the value goes through the native setter to be picked up.
+            # Only the form's own inputs are filled, never the page's search boxes
+            self.driver.execute_script("""
+                const setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+                document.querySelector(arguments[0]).querySelectorAll(arguments[1]).forEach(inp => {
+                    if (inp.value) return;
+                    setter.call(inp, 'Automated');
+                    inp.dispatchEvent(new Event('input', {bubbles: true}));
+                    inp.dispatchEvent(new Event('change', {bubbles: true}));
+                });
+            """, EASY_APPLY_FORM_SEL, TEXT_INPUT_SEL)
+        except (TimeoutException, JavascriptException) as e:
+            # A form without fillable inputs can still be submitted
+            logger.debug("Application form not filled: %s", e)
 
     def log_application(self, title, company, country, link, status):
-        """Log application to Google Sheets"""
+        """Queue an application row, writing to Google Sheets once a full batch is pending"""
+        row = [
+            self.applications_count + 1,
+            self._today,
+            title,
+            company,
+            country,
+            link,
+            self._salary_str,
+            status,
+            "Automated"
+        ]
+        self._pending_rows.append(row)
+        if len(self._pending_rows) >= SHEETS_BATCH_SIZE:
+            self._flush_rows()
+
+    def _flush_rows(self, wait=False):
+        """Hand all pending rows to the I/O thread to be written to Google Sheets in a single request"""
+        self._collect_flush(SHEETS_FLUSH_TIMEOUT)
+        if self._pending_rows and self.sheets:
+            batch, self._pending_rows = self._pending_rows, []
+            self._flush = (self._io_pool.submit(self._write_rows, batch), batch)
+        if wait:
+            # The interpreter joins the I/O thread at exit anyway, so the last write is waited for in full
+            self._collect_flush(None)
+
+    def _collect_flush(self, timeout):
+        """Wait for the previous write to finish, queueing its rows again if it failed"""
+        if self._flush is None:
+            return
+        (future, batch), self._flush = self._flush, None
         try:
-            today = datetime.now().strftime("%d/%m/%Y")
-            row = [
-                self.applications_count + 1,
-                today,
-                title,
-                company,
-                country,
-                link,
-                f"${MIN_SALARY_USD}+",
-                status,
-                "Automated"
-            ]
-            self.worksheet.append_row(row)
-            print(f"✓ Logged to Google Sheets: {title}")
+            future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # The request may still land, so the rows are not queued again
+            logger.error("✗ Sheets write of %d rows did not finish in %ds", len(batch), SHEETS_FLUSH_TIMEOUT)
         except Exception as e:
-            print(f"✗ Failed to log to sheets: {str(e)}")
+            logger.error("✗ Failed to log to sheets: %s", e)
+            self._pending_rows = batch + self._pending_rows
+
+    def _write_rows(self, batch):
+        """Append rows to the sheet; runs on the I/O thread"""
+        # RAW keeps scraped titles from being parsed as formulas; INSERT_ROWS never overwrites cells below the table
+        self.sheets.values().append(
+            spreadsheetId=self.sheet_id,
+            range=SHEETS_RANGE,
+            valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
+            body={'values': batch}
+        ).execute(num_retries=3)
+        logger.info("✓ Logged %d applications to Google Sheets", len(batch))
 
     def run(self):
         """Main execution function"""
+        from pybloom_live import BloomFilter
+        
+        self._seen_links = BloomFilter(capacity=10_000, error_rate=0.001)
+        # Sheets writes run on one background thread so they overlap the next page load;
+        # the API client is only ever used from that thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         try:
-            print("🚀 Starting LinkedIn Job Automation...")
-            self.initialize_driver()
-            self.setup_google_sheets()
-            self.authenticate_linkedin_with_cookies()
-            
-            for country in TARGET_COUNTRIES:
-                if self.applications_count >= MAX_APPLICATIONS_PER_DAY:
-                    break
-                
-                print(f"\n🔍 Searching jobs in {country}...")
-                jobs = self.search_jobs_in_country(country)
+            logger.info("🚀 Starting LinkedIn Job Automation...")
+            with self._managed_driver():
+                self.setup_google_sheets()
+                self.authenticate_linkedin_with_cookies()
+                self._open_seen_cache()
+                self._today = datetime.now().strftime("%d/%m/%Y")
                 
-                for job in jobs:
-                    if self.applications_count >= MAX_APPLICATIONS_PER_DAY:
-                        break
-                    
-                    if self.apply_to_job(job['link'], job['title'], job['company'], country):
-                        time.sleep(APPLICATION_DELAY)
+                next_allowed = 0
+                # Closing the stream once the quota is reached cancels the searches still queued
+                with closing(self._job_stream()) as job_stream:
+                    # Countries without results count too, so recycling follows the countries searched
+                    for countries_done, (country, jobs) in enumerate(job_stream):
+                        if self.applications_count >= self.max_apps:
+                            break
+                        
+                        if countries_done:
+                            self._recycle_driver(countries_done)
+                        
+                        for job in jobs:
+                            if self.applications_count >= self.max_apps:
+                                break
+                            
+                            # Postings overlap across countries and repeat between daily runs
+                            if self._is_duplicate(job):
+                                continue
+                            
+                            if self.apply_to_job(job['link'], job['title'], job['company'], country, next_allowed):
+                                self._seen_cache[self._cache_key(job['link'])] = time.time()
+                                next_allowed = time.monotonic() + APPLICATION_DELAY
             
-            print(f"\n✅ Completed! Applied to {self.applications_count} jobs")
+            logger.info("✅ Completed! Applied to %d jobs", self.applications_count)
         except Exception as e:
-            print(f"❌ Error: {str(e)}")
+            logger.error("❌ Error: %s", e)
         finally:
-            if self.driver:
-                self.driver.quit()
+            # The browser is already closed here, so queued rows are written even if it crashed.
+            # Nothing is left running on the I/O thread once every write has been waited for
+            self._flush_rows(wait=True)
+            self._io_pool.shutdown()
+            if self._seen_cache is not None:
+                self._seen_cache.close()
 
-if __name__ == "__main__":
+# Search worker process state, set up once per process by _init_search_worker
+_search_worker = None
+
+def _init_search_worker():
+    """Process pool initializer: open and sign in the browser this worker reuses for every country"""
+    from multiprocessing.util import Finalize
+    
+    global _search_worker
+    _search_worker = LinkedInJobAutomation()
+    try:
+        # Chrome locks its profile directory, so search workers run without one
+        driver = _search_worker._make_driver()
+        Finalize(None, _search_worker._quit_driver, args=(driver,), exitpriority=10)
+        _search_worker.driver = driver
+        _search_worker.authenticate_linkedin_with_cookies(saved_profile=False)
+    except Exception as e:
+        logger.warning("✗ Search worker could not start its browser: %s", e)
+        _search_worker.driver = None
+
+def scrape_country(country, url):
+    """Search a country with the calling worker process's own browser"""
+    if _search_worker.driver is None:
+        return []
+    return _search_worker.search_jobs_in_country(_search_worker.driver, country, url)
+
+def main():
+    """Check the environment before any heavy import, then run the automation"""
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s %(message)s",
+        stream=sys.stderr
+    )
+    
+    missing = [name for name in REQUIRED_ENV_VARS if not os.environ.get(name)]
+    if missing:
+        logger.error("❌ Missing environment variables: %s", ", ".join(missing))
+        return 1
+    
     automation = LinkedInJobAutomation()
     automation.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
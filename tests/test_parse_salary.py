@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from main import parse_salary  # noqa: E402
+
+
+@pytest.mark.parametrize("text, expected", [
+    # English periods and magnitudes
+    ("$60k/yr", 5000),
+    ("$25 / hr", 25 * 2080 / 12),
+    ("$25.50 an hour", 25.5 * 2080 / 12),
+    ("US$ 3,000 per month", 3000),
+    ("$1.2M a year", 100000),
+    ("$80k+ per year", 80000 / 12),
+    ("$60k - $80k/yr", 80000 / 12),
+    # Spanish periods and thousands separators
+    ("$2.500 USD por mes", 2500),
+    ("USD $1,200 mensuales", 1200),
+    ("$2.000 al mes", 2000),
+    ("$36.000 anuales", 3000),
+    ("$20 la hora", 20 * 2080 / 12),
+    # Stipends and perks do not hide the salary
+    ("Perks: $500/year learning budget, $100/month home office stipend. Pay: $5,000/month", 5000),
+    ("$5,000/month plus bonus", 5000),
+    ("Salario de $3.000 USD mensuales; viáticos de $100 USD al mes", 3000),
+])
+def test_parses_monthly_usd(text, expected):
+    assert parse_salary(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Up to $120,000",
+    "We raised $50M",
+    "$3,000 more than last year",
+    "$1.500.000 ARS mensuales",
+    "MXN $30,000 al mes",
+    "$100 USD",
+    "We offer a $50/month internet allowance",
+    "Beca de $200 USD al mes",
+])
+def test_ignores_amounts_that_are_not_usd_pay(text):
+    assert parse_salary(text) is None